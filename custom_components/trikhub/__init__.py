@@ -2,18 +2,23 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Awaitable, Callable
 import logging
-from typing import Any
+from typing import Any, Generic, TypeVar
 
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .client import TrikHubClient, TrikHubClientError
 from .const import (
+    ATTR_ENTRY_ID,
     ATTR_INPUT,
     ATTR_NAME,
     ATTR_PACKAGE,
@@ -24,6 +29,10 @@ from .const import (
     CONF_LLM_PROVIDER,
     CONF_SERVER_URL,
     DOMAIN,
+    EXECUTE_BATCH_MAX_SIZE,
+    EXECUTE_BATCH_WINDOW,
+    INSTALL_BATCH_MAX_SIZE,
+    INSTALL_BATCH_WINDOW,
     SERVICE_EXECUTE_TRIK,
     SERVICE_INSTALL_TRIK,
     SERVICE_UNINSTALL_TRIK,
@@ -33,46 +42,180 @@ _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[Platform] = [Platform.CONVERSATION]
 
+SERVICES = (SERVICE_EXECUTE_TRIK, SERVICE_INSTALL_TRIK, SERVICE_UNINSTALL_TRIK)
+
+_ItemT = TypeVar("_ItemT")
+
 SERVICE_EXECUTE_TRIK_SCHEMA = vol.Schema(
     {
         vol.Required(ATTR_TOOL): cv.string,
-        vol.Optional(ATTR_INPUT, default={}): dict,
+        vol.Optional(ATTR_INPUT, default=dict): dict,
+        vol.Optional(ATTR_ENTRY_ID): cv.string,
     }
 )
 
 SERVICE_INSTALL_TRIK_SCHEMA = vol.Schema(
     {
         vol.Required(ATTR_PACKAGE): cv.string,
+        vol.Optional(ATTR_ENTRY_ID): cv.string,
     }
 )
 
 SERVICE_UNINSTALL_TRIK_SCHEMA = vol.Schema(
     {
         vol.Required(ATTR_NAME): cv.string,
+        vol.Optional(ATTR_ENTRY_ID): cv.string,
     }
 )
 
 
+class _BatchCoalescer(Generic[_ItemT]):
+    """Coalesce concurrent service calls into batched requests.
+
+    Items arriving within a short window are sent to the server as a single
+    batch and the results are fanned back out to each caller.
+    """
+
+    def __init__(
+        self,
+        single: Callable[[_ItemT], Awaitable[dict[str, Any]]],
+        bulk: Callable[[list[_ItemT]], Awaitable[list[dict[str, Any] | BaseException]]],
+        window: float,
+        max_size: int,
+    ) -> None:
+        """Initialize the coalescer.
+
+        Args:
+            single: Sends one item; used when a window holds a single item.
+            bulk: Sends several items and returns one result per item.
+            window: Seconds to wait for more items after the first arrives.
+            max_size: Maximum number of items per batch.
+        """
+        self._single = single
+        self._bulk = bulk
+        self._window = window
+        self._max_size = max_size
+        self._queue: asyncio.Queue[
+            tuple[_ItemT, asyncio.Future[dict[str, Any]]]
+        ] = asyncio.Queue()
+        self._pending: set[asyncio.Task[None]] = set()
+        # Items taken off the queue while waiting for the window to close
+        self._batch: list[tuple[_ItemT, asyncio.Future[dict[str, Any]]]] = []
+        self._stopped = False
+
+    async def submit(self, item: _ItemT) -> dict[str, Any]:
+        """Queue an item and wait for its result.
+
+        Raises:
+            TrikHubClientError: If the coalescer has stopped.
+        """
+        if self._stopped:
+            raise TrikHubClientError("TrikHub integration unloaded")
+        future: asyncio.Future[dict[str, Any]] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._queue.put_nowait((item, future))
+        return await future
+
+    async def run(self) -> None:
+        """Drain the queue and dispatch batches until cancelled."""
+        try:
+            while True:
+                self._batch = [await self._queue.get()]
+                await asyncio.sleep(self._window)
+                while len(self._batch) < self._max_size and not self._queue.empty():
+                    self._batch.append(self._queue.get_nowait())
+
+                # Dispatch without blocking collection of the next batch
+                batch, self._batch = self._batch, []
+                task = asyncio.create_task(self._dispatch(batch))
+                self._pending.add(task)
+                task.add_done_callback(self._pending.discard)
+        finally:
+            self._stopped = True
+            self._fail_waiting(TrikHubClientError("TrikHub integration unloaded"))
+
+    async def _dispatch(
+        self,
+        batch: list[tuple[_ItemT, asyncio.Future[dict[str, Any]]]],
+    ) -> None:
+        """Send one batch to the server and resolve the waiting futures."""
+        items = [item for item, _ in batch]
+        try:
+            if len(items) == 1:
+                results: list[dict[str, Any] | BaseException] = [
+                    await self._single(items[0])
+                ]
+            else:
+                results = await self._bulk(items)
+        except Exception as err:  # Never leave callers waiting
+            results = [err] * len(items)
+
+        if len(results) != len(items):
+            err = TrikHubClientError("Batch response does not match request")
+            results = [err] * len(items)
+
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    def _fail_waiting(self, err: Exception) -> None:
+        """Fail every item not yet dispatched, in the open batch or the queue."""
+        waiting, self._batch = self._batch, []
+        while not self._queue.empty():
+            waiting.append(self._queue.get_nowait())
+        for _, future in waiting:
+            if not future.done():
+                future.set_exception(err)
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up TrikHub from a config entry."""
     server_url = entry.data[CONF_SERVER_URL]
     auth_token = entry.data.get(CONF_AUTH_TOKEN)
 
-    # Create the client
-    client = TrikHubClient(server_url, auth_token)
+    # Create the client on Home Assistant's shared session
+    client = TrikHubClient(
+        server_url, auth_token, session=async_get_clientsession(hass)
+    )
 
     # Verify connection
     try:
         await client.health_check()
     except TrikHubClientError as err:
         _LOGGER.error("Failed to connect to TrikHub server: %s", err)
-        await client.close()
         return False
 
+    # Coalesce concurrent execute_trik and install_trik calls into batches
+    execute_batcher: _BatchCoalescer[dict[str, Any]] = _BatchCoalescer(
+        lambda call: client.execute(call["tool"], call["input"]),
+        client.execute_batch,
+        EXECUTE_BATCH_WINDOW,
+        EXECUTE_BATCH_MAX_SIZE,
+    )
+    install_batcher: _BatchCoalescer[str] = _BatchCoalescer(
+        client.install_trik,
+        client.install_triks_bulk,
+        INSTALL_BATCH_WINDOW,
+        INSTALL_BATCH_MAX_SIZE,
+    )
+    entry.async_create_background_task(
+        hass, execute_batcher.run(), f"{DOMAIN}_execute_batch_{entry.entry_id}"
+    )
+    entry.async_create_background_task(
+        hass, install_batcher.run(), f"{DOMAIN}_install_batch_{entry.entry_id}"
+    )
+
     # Store client and config in hass.data
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = {
+    first_entry = not hass.data.get(DOMAIN)
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {
         "client": client,
+        "execute_batcher": execute_batcher,
+        "install_batcher": install_batcher,
         "config": {
             CONF_SERVER_URL: server_url,
             CONF_AUTH_TOKEN: auth_token,
@@ -82,8 +225,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         },
     }
 
-    # Register services
-    await _async_register_services(hass, client)
+    # Services are global, so only the first entry registers them
+    if first_entry:
+        await _async_register_services(hass)
 
     # Set up platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -96,25 +240,55 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     if unload_ok:
-        data = hass.data[DOMAIN].pop(entry.entry_id)
-        client: TrikHubClient = data["client"]
-        await client.close()
+        hass.data[DOMAIN].pop(entry.entry_id)
+
+        # Remove the global services with the last entry
+        if not hass.data[DOMAIN]:
+            for service in SERVICES:
+                hass.services.async_remove(DOMAIN, service)
 
     return unload_ok
 
 
-async def _async_register_services(hass: HomeAssistant, client: TrikHubClient) -> None:
-    """Register TrikHub services."""
+def _get_entry_data(hass: HomeAssistant, call: ServiceCall) -> dict[str, Any]:
+    """Resolve the config entry data a service call targets.
+
+    The entry_id attribute selects an entry explicitly; it may be omitted
+    when only one TrikHub entry is loaded.
+    """
+    entries: dict[str, dict[str, Any]] = hass.data.get(DOMAIN, {})
+
+    if entry_id := call.data.get(ATTR_ENTRY_ID):
+        if entry_id not in entries:
+            raise HomeAssistantError(f"TrikHub entry {entry_id} is not loaded")
+        return entries[entry_id]
+
+    if len(entries) != 1:
+        raise HomeAssistantError(
+            f"{len(entries)} TrikHub entries are loaded, specify {ATTR_ENTRY_ID}"
+        )
+    return next(iter(entries.values()))
+
+
+async def _async_register_services(hass: HomeAssistant) -> None:
+    """Register TrikHub services.
+
+    Handlers look up the target client on each call, so one set of services
+    serves every config entry.
+    """
 
     async def handle_execute_trik(call: ServiceCall) -> dict[str, Any]:
         """Handle the execute_trik service call."""
         tool = call.data[ATTR_TOOL]
-        input_data = call.data.get(ATTR_INPUT, {})
+        input_data = call.data[ATTR_INPUT]
+        batcher: _BatchCoalescer[dict[str, Any]] = _get_entry_data(hass, call)[
+            "execute_batcher"
+        ]
 
         _LOGGER.debug("Executing trik tool: %s with input: %s", tool, input_data)
 
         try:
-            result = await client.execute(tool, input_data)
+            result = await batcher.submit({"tool": tool, "input": input_data})
             _LOGGER.debug("Trik execution result: %s", result)
             return result
         except TrikHubClientError as err:
@@ -124,11 +298,12 @@ async def _async_register_services(hass: HomeAssistant, client: TrikHubClient) -
     async def handle_install_trik(call: ServiceCall) -> dict[str, Any]:
         """Handle the install_trik service call."""
         package = call.data[ATTR_PACKAGE]
+        batcher: _BatchCoalescer[str] = _get_entry_data(hass, call)["install_batcher"]
 
         _LOGGER.info("Installing trik: %s", package)
 
         try:
-            result = await client.install_trik(package)
+            result = await batcher.submit(package)
             _LOGGER.info("Trik installed: %s", result)
             return result
         except TrikHubClientError as err:
@@ -138,6 +313,7 @@ async def _async_register_services(hass: HomeAssistant, client: TrikHubClient) -
     async def handle_uninstall_trik(call: ServiceCall) -> dict[str, Any]:
         """Handle the uninstall_trik service call."""
         name = call.data[ATTR_NAME]
+        client: TrikHubClient = _get_entry_data(hass, call)["client"]
 
         _LOGGER.info("Uninstalling trik: %s", name)
 
@@ -149,27 +325,21 @@ async def _async_register_services(hass: HomeAssistant, client: TrikHubClient) -
             _LOGGER.error("Failed to uninstall trik: %s", err)
             raise
 
-    # Only register if not already registered
-    if not hass.services.has_service(DOMAIN, SERVICE_EXECUTE_TRIK):
-        hass.services.async_register(
-            DOMAIN,
-            SERVICE_EXECUTE_TRIK,
-            handle_execute_trik,
-            schema=SERVICE_EXECUTE_TRIK_SCHEMA,
-        )
-
-    if not hass.services.has_service(DOMAIN, SERVICE_INSTALL_TRIK):
-        hass.services.async_register(
-            DOMAIN,
-            SERVICE_INSTALL_TRIK,
-            handle_install_trik,
-            schema=SERVICE_INSTALL_TRIK_SCHEMA,
-        )
-
-    if not hass.services.has_service(DOMAIN, SERVICE_UNINSTALL_TRIK):
-        hass.services.async_register(
-            DOMAIN,
-            SERVICE_UNINSTALL_TRIK,
-            handle_uninstall_trik,
-            schema=SERVICE_UNINSTALL_TRIK_SCHEMA,
-        )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_EXECUTE_TRIK,
+        handle_execute_trik,
+        schema=SERVICE_EXECUTE_TRIK_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_INSTALL_TRIK,
+        handle_install_trik,
+        schema=SERVICE_INSTALL_TRIK_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_UNINSTALL_TRIK,
+        handle_uninstall_trik,
+        schema=SERVICE_UNINSTALL_TRIK_SCHEMA,
+    )
@@ -2,23 +2,55 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
+from collections.abc import Awaitable, Callable
+from time import monotonic
 from typing import Any
+from urllib.parse import quote
 
 import aiohttp
+from yarl import URL
+
+try:
+    import orjson
+except ImportError:  # orjson ships with Home Assistant but is optional here
+    orjson = None  # type: ignore
 
 from .const import (
+    API_CAPABILITIES,
     API_CONTENT,
     API_EXECUTE,
+    API_EXECUTE_BATCH,
     API_HEALTH,
     API_TOOLS,
     API_TRIKS,
     API_TRIKS_INSTALL,
     API_TRIKS_RELOAD,
+    CACHE_TTL_HEALTH,
+    CACHE_TTL_TOOLS,
+    CAP_BULK_INSTALL,
+    CAP_EXECUTE_BATCH,
+    MAX_RESPONSE_BYTES,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Prefer orjson for response bodies, falling back to the stdlib.
+# Request bodies are serialized by the shared Home Assistant session.
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Exact body of a healthy health check
+_HEALTH_OK_BYTES = b'{"status":"ok"}'
+
+
+def _health_loads(raw: bytes) -> Any:
+    """Decode a health check body, skipping the JSON decoder when healthy."""
+    if raw == _HEALTH_OK_BYTES:
+        return {"status": "ok"}
+    return _json_loads(raw)
+
 
 class TrikHubClientError(Exception):
     """Base exception for TrikHub client errors."""
@@ -32,59 +64,163 @@ class TrikHubAuthError(TrikHubClientError):
     """Authentication error with TrikHub server."""
 
 
+class TrikHubNotFoundError(TrikHubClientError):
+    """Requested resource or endpoint does not exist on the TrikHub server."""
+
+
+def _batch_results(data: Any) -> list[dict[str, Any] | BaseException]:
+    """Unpack a batch response into one result (or exception) per item.
+
+    Accepts a bare JSON array or an object with a 'results' array. Items
+    carrying an 'error' become TrikHubClientError, as they would when sent
+    on their own.
+
+    Raises:
+        TrikHubClientError: If the response is not a list of results.
+    """
+    items = data.get("results") if isinstance(data, dict) else data
+    if not isinstance(items, list):
+        raise TrikHubClientError("Invalid batch response")
+
+    results: list[dict[str, Any] | BaseException] = []
+    for item in items:
+        if not isinstance(item, dict):
+            results.append(TrikHubClientError("Invalid batch result"))
+        elif item.get("error"):
+            results.append(TrikHubClientError(str(item["error"])))
+        else:
+            results.append(item)
+    return results
+
+
 class TrikHubClient:
     """HTTP client for TrikHub server."""
 
+    __slots__ = (
+        "base_url",
+        "_auth_token",
+        "_cache",
+        "_caps",
+        "_headers",
+        "_inflight",
+        "_session",
+        "_urls",
+    )
+
+    # The shared session has its own timeout; TrikHub calls use a tighter one
+    # and fail fast when the server is unreachable
+    REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=30, connect=5, sock_read=25)
+
     def __init__(
         self,
         base_url: str,
         auth_token: str | None = None,
-        session: aiohttp.ClientSession | None = None,
+        *,
+        session: aiohttp.ClientSession,
     ) -> None:
         """Initialize the TrikHub client.
 
         Args:
             base_url: The base URL of the TrikHub server.
             auth_token: Optional bearer token for authentication.
-            session: Optional aiohttp session to use.
+            session: The aiohttp session to use, normally Home Assistant's
+                shared session from async_get_clientsession.
         """
         self.base_url = base_url.rstrip("/")
+        # Endpoint URLs are parsed once rather than on every request
+        self._urls: dict[str, URL] = {
+            endpoint: URL(f"{self.base_url}{endpoint}")
+            for endpoint in (
+                API_CAPABILITIES,
+                API_CONTENT,
+                API_EXECUTE,
+                API_EXECUTE_BATCH,
+                API_HEALTH,
+                API_TOOLS,
+                API_TRIKS,
+                API_TRIKS_INSTALL,
+                API_TRIKS_RELOAD,
+            )
+        }
+        self._headers: dict[str, str] = {}
         self.auth_token = auth_token
         self._session = session
-        self._owned_session = False
-
-    async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create an aiohttp session."""
-        if self._session is None:
-            self._session = aiohttp.ClientSession()
-            self._owned_session = True
-        return self._session
+        # Optional server features, fetched once; a missing key is unknown
+        self._caps: dict[str, bool] | None = None
+        # Short-lived response cache: endpoint -> (timestamp, data)
+        self._cache: dict[str, tuple[float, Any]] = {}
+        # Fetches in progress, shared by concurrent callers: endpoint -> task
+        self._inflight: dict[str, asyncio.Task[Any]] = {}
+
+    @property
+    def auth_token(self) -> str | None:
+        """Return the bearer token used for authentication."""
+        return self._auth_token
+
+    @auth_token.setter
+    def auth_token(self, value: str | None) -> None:
+        """Set the bearer token and rebuild the request headers.
+
+        Content-Type is set by aiohttp for JSON bodies, so only the
+        Authorization header is kept here.
+        """
+        self._auth_token = value
+        self._headers = {"Authorization": f"Bearer {value}"} if value else {}
 
     async def close(self) -> None:
-        """Close the client session if we own it."""
-        if self._owned_session and self._session:
-            await self._session.close()
-            self._session = None
-
-    def _get_headers(self) -> dict[str, str]:
-        """Get headers for API requests."""
-        headers = {"Content-Type": "application/json"}
-        if self.auth_token:
-            headers["Authorization"] = f"Bearer {self.auth_token}"
-        return headers
+        """Close the client.
+
+        The shared session is owned by Home Assistant, so there is nothing to
+        release. Kept for backward compatibility.
+        """
+
+    async def __aenter__(self) -> TrikHubClient:
+        """Enter the client context."""
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Close the client when leaving the context."""
+        await self.close()
+
+    @staticmethod
+    async def _read_body(response: aiohttp.ClientResponse) -> bytes:
+        """Read a response body, refusing anything over MAX_RESPONSE_BYTES.
+
+        Reading the body to the end also hands the connection back to the
+        pool as soon as the data is in memory.
+
+        Raises:
+            TrikHubClientError: If the body exceeds the size limit.
+        """
+        if (
+            response.content_length is not None
+            and response.content_length > MAX_RESPONSE_BYTES
+        ):
+            raise TrikHubClientError("Response too large")
+
+        chunks: list[bytes] = []
+        size = 0
+        async for chunk in response.content.iter_chunked(64 * 1024):
+            size += len(chunk)
+            if size > MAX_RESPONSE_BYTES:
+                raise TrikHubClientError("Response too large")
+            chunks.append(chunk)
+        return b"".join(chunks)
 
     async def _request(
         self,
         method: str,
-        endpoint: str,
+        url: URL,
         json_data: dict[str, Any] | None = None,
+        loads: Callable[[bytes], Any] = _json_loads,
     ) -> dict[str, Any]:
         """Make an HTTP request to the TrikHub server.
 
         Args:
             method: HTTP method (GET, POST, DELETE).
-            endpoint: API endpoint path.
+            url: Endpoint URL, usually from self._urls.
             json_data: Optional JSON body for POST requests.
+            loads: Decoder for the response body.
 
         Returns:
             Response data as a dictionary.
@@ -92,23 +228,42 @@ class TrikHubClient:
         Raises:
             TrikHubConnectionError: If connection fails.
             TrikHubAuthError: If authentication fails.
+            TrikHubNotFoundError: If the endpoint or resource does not exist.
             TrikHubClientError: For other API errors.
         """
-        session = await self._get_session()
-        url = f"{self.base_url}{endpoint}"
-        headers = self._get_headers()
-
         try:
-            async with session.request(
-                method, url, headers=headers, json=json_data, timeout=30
+            async with self._session.request(
+                method,
+                url,
+                headers=self._headers,
+                json=json_data,
+                timeout=self.REQUEST_TIMEOUT,
             ) as response:
                 if response.status == 401:
                     raise TrikHubAuthError("Authentication failed")
                 if response.status == 403:
                     raise TrikHubAuthError("Access forbidden")
 
-                data = await response.json()
-
+                # Non-JSON error bodies (proxy pages, plain-text 5xx) are
+                # not worth reading; report the status line instead
+                if response.status >= 400 and "json" not in response.content_type:
+                    error_cls = (
+                        TrikHubNotFoundError
+                        if response.status == 404
+                        else TrikHubClientError
+                    )
+                    raise error_cls(f"HTTP {response.status}: {response.reason}")
+
+                raw = await self._read_body(response)
+                try:
+                    data = loads(raw) if raw else {}
+                except ValueError as err:
+                    raise TrikHubClientError(
+                        f"Invalid JSON response (HTTP {response.status})"
+                    ) from err
+
+                if response.status == 404:
+                    raise TrikHubNotFoundError(data.get("error", "Not found"))
                 if response.status >= 400:
                     error_msg = data.get("error", f"HTTP {response.status}")
                     raise TrikHubClientError(error_msg)
@@ -122,13 +277,110 @@ class TrikHubClient:
         except aiohttp.ClientError as err:
             raise TrikHubClientError(f"Request failed: {err}") from err
 
+    async def _cached(
+        self,
+        key: str,
+        ttl: float,
+        fetch: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Return a cached value, calling fetch when missing or expired.
+
+        Concurrent callers on a missing or expired key share one fetch.
+
+        Args:
+            key: Cache key (the API endpoint).
+            ttl: Time to live in seconds.
+            fetch: Coroutine factory that fetches a fresh value.
+
+        Returns:
+            The cached or freshly fetched value.
+        """
+        now = monotonic()
+        entry = self._cache.get(key)
+        if entry is not None and now - entry[0] < ttl:
+            return entry[1]
+
+        task = self._inflight.get(key)
+        if task is None:
+
+            async def fetch_and_store() -> Any:
+                value = await fetch()
+                # Skip storing if the key was invalidated while fetching
+                if self._inflight.get(key) is task:
+                    self._cache[key] = (now, value)
+                return value
+
+            def done(_: asyncio.Task[Any]) -> None:
+                if self._inflight.get(key) is task:
+                    del self._inflight[key]
+
+            task = self._inflight[key] = asyncio.create_task(fetch_and_store())
+            task.add_done_callback(done)
+
+        # Shielded so a cancelled caller does not cancel the shared fetch
+        return await asyncio.shield(task)
+
+    def _invalidate_tools(self) -> None:
+        """Drop cached tool and trik listings after the installed set changes."""
+        self._cache.pop(API_TOOLS, None)
+        self._inflight.pop(API_TOOLS, None)
+
+    async def capabilities(self) -> dict[str, bool]:
+        """Return the optional features the server supports.
+
+        Fetched once per client. Servers without the capabilities endpoint
+        may advertise them in the tools response instead. Features missing
+        from both are left out and detected on first use; if neither can be
+        read, all features are treated as unknown.
+
+        Returns:
+            Mapping of capability name to whether it is supported.
+
+        Raises:
+            TrikHubAuthError: If the server rejects the credentials.
+        """
+        if self._caps is None:
+            try:
+                try:
+                    data = await self._request("GET", self._urls[API_CAPABILITIES])
+                except TrikHubNotFoundError:
+                    data = (await self._get_tools_data()).get("capabilities", {})
+            except TrikHubAuthError:
+                raise
+            except TrikHubClientError as err:
+                _LOGGER.debug("Server capabilities unavailable: %s", err)
+                data = {}
+            if not isinstance(data, dict):
+                data = {}
+            self._caps = {
+                cap: bool(data[cap])
+                for cap in (CAP_EXECUTE_BATCH, CAP_BULK_INSTALL)
+                if cap in data
+            }
+        return self._caps
+
     async def health_check(self) -> dict[str, Any]:
         """Check if the TrikHub server is healthy.
 
         Returns:
             Health check response data.
         """
-        return await self._request("GET", API_HEALTH)
+        return await self._cached(
+            API_HEALTH,
+            CACHE_TTL_HEALTH,
+            lambda: self._request(
+                "GET", self._urls[API_HEALTH], loads=_health_loads
+            ),
+        )
+
+    async def _get_tools_data(self) -> dict[str, Any]:
+        """Fetch the tools endpoint, shared by get_tools and get_triks."""
+
+        return await self._cached(
+            API_TOOLS,
+            CACHE_TTL_TOOLS,
+            lambda: self._request("GET", self._urls[API_TOOLS]),
+        )
 
     async def get_tools(self) -> list[dict[str, Any]]:
         """Fetch available tools from TrikHub server.
@@ -136,7 +388,7 @@ class TrikHubClient:
         Returns:
             List of tool definitions with name, description, and inputSchema.
         """
-        data = await self._request("GET", API_TOOLS)
+        data = await self._get_tools_data()
         return data.get("tools", [])
 
     async def get_triks(self) -> list[dict[str, Any]]:
@@ -145,7 +397,7 @@ class TrikHubClient:
         Returns:
             List of trik info with id, name, description, and tools.
         """
-        data = await self._request("GET", API_TOOLS)
+        data = await self._get_tools_data()
         return data.get("triks", [])
 
     async def execute(
@@ -168,7 +420,40 @@ class TrikHubClient:
         if session_id:
             payload["sessionId"] = session_id
 
-        return await self._request("POST", API_EXECUTE, payload)
+        return await self._request("POST", self._urls[API_EXECUTE], payload)
+
+    async def execute_batch(
+        self, calls: list[dict[str, Any]]
+    ) -> list[dict[str, Any] | BaseException]:
+        """Execute several trik tools in one round trip.
+
+        Falls back to concurrent single executions if the server does not
+        provide the batch endpoint. Support comes from the server
+        capabilities, or is detected on first use and cached.
+
+        Args:
+            calls: List of calls, each with 'tool' and 'input' keys.
+
+        Returns:
+            One execution result (or exception) per call, in order.
+        """
+        caps = await self.capabilities()
+        if caps.get(CAP_EXECUTE_BATCH) is not False:
+            try:
+                data = await self._request(
+                    "POST", self._urls[API_EXECUTE_BATCH], {"calls": calls}
+                )
+            except TrikHubNotFoundError:
+                _LOGGER.debug("Batch execution not supported, using single calls")
+                caps[CAP_EXECUTE_BATCH] = False
+            else:
+                caps[CAP_EXECUTE_BATCH] = True
+                return _batch_results(data)
+
+        return await asyncio.gather(
+            *(self.execute(call["tool"], call["input"]) for call in calls),
+            return_exceptions=True,
+        )
 
     async def get_content(self, ref: str) -> dict[str, Any] | None:
         """Fetch passthrough content by reference.
@@ -181,8 +466,9 @@ class TrikHubClient:
         Returns:
             Content data with content, contentType, and metadata, or None if not found.
         """
+        url = self._urls[API_CONTENT].joinpath(quote(ref, safe=""), encoded=True)
         try:
-            return await self._request("GET", f"{API_CONTENT}/{ref}")
+            return await self._request("GET", url)
         except TrikHubClientError:
             return None
 
@@ -192,7 +478,7 @@ class TrikHubClient:
         Returns:
             List of installed trik info with name and version.
         """
-        data = await self._request("GET", API_TRIKS)
+        data = await self._request("GET", self._urls[API_TRIKS])
         return data.get("triks", [])
 
     async def install_trik(self, package: str) -> dict[str, Any]:
@@ -204,7 +490,41 @@ class TrikHubClient:
         Returns:
             Installation result.
         """
-        return await self._request("POST", API_TRIKS_INSTALL, {"package": package})
+        result = await self._request(
+            "POST", self._urls[API_TRIKS_INSTALL], {"package": package}
+        )
+        self._invalidate_tools()
+        return result
+
+    async def install_triks_bulk(
+        self, packages: list[str]
+    ) -> list[dict[str, Any] | BaseException]:
+        """Install several triks from the registry in one request.
+
+        Bulk installs share the single-install endpoint, where servers
+        without bulk support reject the body rather than answering 404. The
+        bulk body is therefore only sent when the server capabilities
+        advertise it; otherwise packages are installed concurrently with
+        single requests.
+
+        Args:
+            packages: Package names to install.
+
+        Returns:
+            One installation result (or exception) per package, in order.
+        """
+        caps = await self.capabilities()
+        if caps.get(CAP_BULK_INSTALL):
+            data = await self._request(
+                "POST", self._urls[API_TRIKS_INSTALL], {"packages": packages}
+            )
+            self._invalidate_tools()
+            return _batch_results(data)
+
+        return await asyncio.gather(
+            *(self.install_trik(package) for package in packages),
+            return_exceptions=True,
+        )
 
     async def uninstall_trik(self, name: str) -> dict[str, Any]:
         """Uninstall a trik.
@@ -216,8 +536,10 @@ class TrikHubClient:
             Uninstallation result.
         """
         # URL encode the name for path parameter
-        encoded_name = name.replace("@", "%40").replace("/", "%2F")
-        return await self._request("DELETE", f"{API_TRIKS}/{encoded_name}")
+        url = self._urls[API_TRIKS].joinpath(quote(name, safe=""), encoded=True)
+        result = await self._request("DELETE", url)
+        self._invalidate_tools()
+        return result
 
     async def reload_triks(self) -> dict[str, Any]:
         """Reload all triks.
@@ -225,7 +547,9 @@ class TrikHubClient:
         Returns:
             Reload result with count of loaded triks.
         """
-        return await self._request("POST", API_TRIKS_RELOAD)
+        result = await self._request("POST", self._urls[API_TRIKS_RELOAD])
+        self._invalidate_tools()
+        return result
 
     def convert_tool_to_llm_format(
         self, tool: dict[str, Any]
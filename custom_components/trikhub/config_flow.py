@@ -9,6 +9,7 @@ import voluptuous as vol
 
 from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
 from homeassistant.core import callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.selector import (
     SelectSelector,
     SelectSelectorConfig,
@@ -90,18 +91,21 @@ class TrikHubConfigFlow(ConfigFlow, domain=DOMAIN):
             self._auth_token = user_input.get(CONF_AUTH_TOKEN)
 
             # Validate connection to TrikHub server
-            client = TrikHubClient(self._server_url, self._auth_token)
+            client = TrikHubClient(
+                self._server_url,
+                self._auth_token,
+                session=async_get_clientsession(self.hass),
+            )
             try:
                 await client.health_check()
-                # Connection successful, proceed to LLM configuration
-                return await self.async_step_llm()
             except TrikHubConnectionError:
                 errors["base"] = "cannot_connect"
             except TrikHubClientError as err:
                 _LOGGER.error("TrikHub server error: %s", err)
                 errors["base"] = "unknown"
-            finally:
-                await client.close()
+            else:
+                # Connection successful, proceed to LLM configuration
+                return await self.async_step_llm()
 
         return self.async_show_form(
             step_id="user",
@@ -162,6 +166,14 @@ class TrikHubOptionsFlowHandler:
     def __init__(self, config_entry) -> None:
         """Initialize options flow."""
         self.config_entry = config_entry
+        self._schema = vol.Schema(
+            {
+                vol.Required(
+                    CONF_LLM_MODEL,
+                    default=config_entry.data.get(CONF_LLM_MODEL, DEFAULT_LLM_MODEL),
+                ): TextSelector(TextSelectorConfig(type=TextSelectorType.TEXT)),
+            }
+        )
 
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
@@ -170,16 +182,4 @@ class TrikHubOptionsFlowHandler:
         if user_input is not None:
             return self.async_create_entry(title="", data=user_input)
 
-        return self.async_show_form(
-            step_id="init",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(
-                        CONF_LLM_MODEL,
-                        default=self.config_entry.data.get(
-                            CONF_LLM_MODEL, DEFAULT_LLM_MODEL
-                        ),
-                    ): TextSelector(TextSelectorConfig(type=TextSelectorType.TEXT)),
-                }
-            ),
-        )
+        return self.async_show_form(step_id="init", data_schema=self._schema)
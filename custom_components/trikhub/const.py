@@ -26,13 +26,32 @@ LLM_PROVIDERS = [
 
 # API endpoints
 API_HEALTH = "/api/v1/health"
+API_CAPABILITIES = "/api/v1/capabilities"
 API_TOOLS = "/api/v1/tools"
 API_EXECUTE = "/api/v1/execute"
+API_EXECUTE_BATCH = "/api/v1/execute:batch"
 API_CONTENT = "/api/v1/content"
 API_TRIKS = "/api/v1/triks"
 API_TRIKS_INSTALL = "/api/v1/triks/install"
 API_TRIKS_RELOAD = "/api/v1/triks/reload"
 
+# Largest response body accepted from the server
+MAX_RESPONSE_BYTES = 16 * 1024 * 1024
+
+# Server capabilities
+CAP_EXECUTE_BATCH = "executeBatch"
+CAP_BULK_INSTALL = "bulkInstall"
+
+# Response cache lifetimes (seconds)
+CACHE_TTL_HEALTH = 5
+CACHE_TTL_TOOLS = 30
+
+# Request batching
+EXECUTE_BATCH_WINDOW = 0.005  # seconds
+EXECUTE_BATCH_MAX_SIZE = 32
+INSTALL_BATCH_WINDOW = 0.02  # seconds
+INSTALL_BATCH_MAX_SIZE = 16
+
 # Service names
 SERVICE_EXECUTE_TRIK = "execute_trik"
 SERVICE_INSTALL_TRIK = "install_trik"
@@ -43,3 +62,4 @@ ATTR_TOOL = "tool"
 ATTR_INPUT = "input"
 ATTR_PACKAGE = "package"
 ATTR_NAME = "name"
+ATTR_ENTRY_ID = "entry_id"
@@ -7,11 +7,30 @@ tools (Triks) alongside Home Assistant's native capabilities.
 
 from __future__ import annotations
 
+import asyncio
+from collections import OrderedDict
+from contextvars import ContextVar
+from datetime import datetime, timedelta
+import functools
 import logging
-from typing import Any, Literal
-
-from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
-from langgraph.graph import StateGraph, MessagesState, START, END
+import re
+from time import monotonic, time
+from typing import Annotated, Any, Literal, TypedDict
+
+import aiosqlite
+import httpx
+from langchain_core.messages import (
+    AIMessage,
+    BaseMessage,
+    HumanMessage,
+    RemoveMessage,
+    SystemMessage,
+    ToolMessage,
+    trim_messages,
+)
+from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+from langgraph.graph import StateGraph, START, END
+from langgraph.graph.message import add_messages
 from langgraph.prebuilt import ToolNode
 
 # Import LLM providers at module level to avoid blocking event loop
@@ -30,6 +49,27 @@ try:
 except ImportError:
     ChatOllama = None  # type: ignore
 
+# Provider SDK errors that are expected in normal operation; Ollama goes
+# through httpx directly, so its timeouts are httpx.TimeoutException
+_TIMEOUT_ERRORS: tuple[type[Exception], ...] = (TimeoutError, httpx.TimeoutException)
+_AUTH_ERRORS: tuple[type[Exception], ...] = ()
+
+try:
+    import openai
+except ImportError:
+    pass
+else:
+    _TIMEOUT_ERRORS += (openai.APITimeoutError,)
+    _AUTH_ERRORS += (openai.AuthenticationError,)
+
+try:
+    import anthropic
+except ImportError:
+    pass
+else:
+    _TIMEOUT_ERRORS += (anthropic.APITimeoutError,)
+    _AUTH_ERRORS += (anthropic.AuthenticationError,)
+
 from homeassistant.components import conversation
 from homeassistant.components.conversation import (
     ConversationEntity,
@@ -41,6 +81,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import intent
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.util import ulid
 
 from .client import TrikHubClient
@@ -53,7 +94,7 @@ from .const import (
     LLM_PROVIDER_OLLAMA,
     LLM_PROVIDER_OPENAI,
 )
-from .tools import load_trik_tools, PassthroughContent
+from .tools import PASSTHROUGH_DELIVERED, load_trik_tools, PassthroughContent
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -78,6 +119,128 @@ IMPORTANT RULES for TrikHub Tools:
 
 Available tools will be shown in your tool list."""
 
+ANTHROPIC_PROMPT_CACHING_HEADERS = {"anthropic-beta": "prompt-caching-2024-07-31"}
+
+# Agent reply recorded when a turn ends on passthrough content
+PASSTHROUGH_ACK = "Content delivered directly to user"
+
+# Generic agent replies that are not worth speaking
+_SKIP_RESPONSES: frozenset[str] = frozenset(
+    {
+        PASSTHROUGH_ACK,
+        "I processed your request but have no response.",
+    }
+)
+
+# Conversation memory, persisted in the Home Assistant config directory
+STATE_DB_FILE = "trikhub_state.db"
+CONVERSATION_RETENTION = timedelta(days=30)
+CONVERSATION_CLEANUP_INTERVAL = timedelta(days=1)
+MAX_HISTORY_MESSAGES = 40
+
+# Response cache for repeated opening questions that need no tools
+RESPONSE_CACHE_SIZE = 128
+RESPONSE_CACHE_TTL = 300  # seconds
+
+_PUNCTUATION_RE = re.compile(r"[^\w\s]")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+# Passthrough content received during the current turn. async_process sets a
+# fresh list per turn; graph nodes and tool calls inherit it through the
+# context, so concurrent conversations never see each other's content.
+_turn_passthrough: ContextVar[list[PassthroughContent] | None] = ContextVar(
+    "trikhub_turn_passthrough", default=None
+)
+
+
+class LLMConfigError(Exception):
+    """The configured LLM provider cannot be used."""
+
+
+class TrikState(TypedDict):
+    """Graph state; new messages are appended by the add_messages reducer."""
+
+    messages: Annotated[list[BaseMessage], add_messages]
+
+
+def _trim_history(messages: list[BaseMessage]) -> list[BaseMessage]:
+    """Bound the prompt to the most recent turns, keeping the system message."""
+    return trim_messages(
+        messages,
+        max_tokens=MAX_HISTORY_MESSAGES,
+        token_counter=len,
+        strategy="last",
+        start_on="human",
+        include_system=True,
+    )
+
+
+def _removed_messages(
+    messages: list[BaseMessage], kept: list[BaseMessage]
+) -> list[RemoveMessage]:
+    """Remove checkpointed messages that fell out of the history window."""
+    kept_ids = {message.id for message in kept}
+    return [
+        RemoveMessage(id=message.id)
+        for message in messages
+        if message.id and message.id not in kept_ids
+    ]
+
+
+def _normalize_query(text: str) -> str:
+    """Normalize user text for response cache lookups."""
+    text = _PUNCTUATION_RE.sub("", text.lower())
+    return _WHITESPACE_RE.sub(" ", text).strip()
+
+
+@functools.lru_cache(maxsize=16)
+def _make_llm(provider: str, model: str, api_key: str | None) -> Any:
+    """Create an LLM client, shared by every caller with the same settings.
+
+    Clients hold HTTP connection pools, so reusing them across setups and
+    tool reloads avoids rebuilding those pools.
+
+    Raises:
+        LLMConfigError: If the provider is unsupported or not installed.
+    """
+    if provider == LLM_PROVIDER_OPENAI:
+        if ChatOpenAI is None:
+            raise LLMConfigError("langchain_openai is not installed")
+        return ChatOpenAI(
+            model=model,
+            api_key=api_key,
+            temperature=0.7,
+        )
+
+    elif provider == LLM_PROVIDER_ANTHROPIC:
+        if ChatAnthropic is None:
+            raise LLMConfigError("langchain_anthropic is not installed")
+        llm = ChatAnthropic(
+            model=model,
+            api_key=api_key,
+            temperature=0.7,
+            default_headers=ANTHROPIC_PROMPT_CACHING_HEADERS,
+        )
+        # The SDK client is created lazily on first use and loads the SSL
+        # trust store (load_verify_locations) as it does; create it here so
+        # that happens wherever the factory runs, not on the first user turn
+        getattr(llm, "_async_client", None)
+        return llm
+
+    elif provider == LLM_PROVIDER_OLLAMA:
+        if ChatOllama is None:
+            raise LLMConfigError("langchain_ollama is not installed")
+        # For Ollama, api_key is actually the base URL
+        return ChatOllama(
+            model=model,
+            base_url=api_key or "http://localhost:11434",
+            temperature=0.7,
+        )
+
+    else:
+        raise LLMConfigError(f"Unsupported LLM provider: {provider}")
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -118,13 +281,24 @@ class TrikHubConversationEntity(
         # LangGraph components (initialized lazily)
         self._graph: Any = None
         self._tools: list[Any] = []
+        self._tool_schemas: dict[str, dict[str, Any]] = {}
         self._llm: Any = None
+        self._llm_with_tools: Any = None
+        # With no tools a turn is a single LLM call, so the graph is skipped
+        self._fast_path = False
+
+        # Static prefix shared by every turn, kept first for prompt caching
+        self._system_message = self._get_system_message()
 
-        # Passthrough content storage
-        self._last_passthrough: PassthroughContent | None = None
+        # Conversation history is kept by the SQLite checkpointer, per
+        # thread_id (opened lazily, see _async_get_checkpointer)
+        self._checkpointer: AsyncSqliteSaver | None = None
+        self._checkpointer_lock = asyncio.Lock()
 
-        # Conversation history storage (per conversation_id)
-        self._conversation_history: dict[str, list[Any]] = {}
+        # Cached answers: (query, language, provider, model) -> (timestamp, response)
+        self._response_cache: OrderedDict[
+            tuple[str, str, str, str], tuple[float, str]
+        ] = OrderedDict()
 
     @property
     def supported_languages(self) -> list[str] | Literal["*"]:
@@ -134,111 +308,241 @@ class TrikHubConversationEntity(
     async def async_added_to_hass(self) -> None:
         """Initialize the graph when entity is added to Home Assistant.
 
-        Note: The first LLM API call may trigger a "blocking call to
-        load_verify_locations" warning from Home Assistant. This is caused by
-        the langchain_anthropic SDK creating SSL contexts lazily during async
-        calls. This is an upstream issue and doesn't affect functionality.
+        The LLM client is built in the executor first, so SDKs that load SSL
+        certificates while creating their HTTP clients do not block the event
+        loop (or trigger Home Assistant's blocking-call warning) on the first
+        user turn.
         """
         await super().async_added_to_hass()
+        self.async_on_remove(
+            async_track_time_interval(
+                self._hass,
+                self._async_cleanup_conversations,
+                CONVERSATION_CLEANUP_INTERVAL,
+            )
+        )
         try:
+            # Build the shared LLM client in the executor, off the event loop
+            await self._hass.async_add_executor_job(
+                _make_llm, *self._llm_params()
+            )
             await self._initialize_graph()
         except Exception as err:
             _LOGGER.warning("Failed to pre-initialize LangGraph: %s", err)
 
-    def _handle_passthrough(self, content: PassthroughContent) -> None:
-        """Store passthrough content for retrieval."""
-        self._last_passthrough = content
-        _LOGGER.debug("Received passthrough content: %s", content.content_type)
+    async def async_will_remove_from_hass(self) -> None:
+        """Close the conversation state database."""
+        await super().async_will_remove_from_hass()
+        if self._checkpointer is not None:
+            await self._checkpointer.conn.close()
+            self._checkpointer = None
+            self._graph = None
+
+    async def _async_get_checkpointer(self) -> AsyncSqliteSaver:
+        """Open the conversation state database on first use."""
+        # Setup and the first turn may race here; open one connection only
+        async with self._checkpointer_lock:
+            if self._checkpointer is None:
+                conn = await aiosqlite.connect(self._hass.config.path(STATE_DB_FILE))
+                checkpointer = AsyncSqliteSaver(conn)
+                await checkpointer.setup()
+                await conn.execute(
+                    "CREATE TABLE IF NOT EXISTS trikhub_threads "
+                    "(thread_id TEXT PRIMARY KEY, last_used REAL NOT NULL)"
+                )
+                await conn.commit()
+                self._checkpointer = checkpointer
+        return self._checkpointer
 
-    def _get_llm(self) -> Any:
-        """Get the configured LLM instance."""
-        provider = self._config.get(CONF_LLM_PROVIDER, LLM_PROVIDER_OPENAI)
-        api_key = self._config.get(CONF_LLM_API_KEY)
-        model = self._config.get(CONF_LLM_MODEL, "gpt-4o-mini")
-
-        if provider == LLM_PROVIDER_OPENAI:
-            if ChatOpenAI is None:
-                raise ValueError("langchain_openai is not installed")
-            return ChatOpenAI(
-                model=model,
-                api_key=api_key,
-                temperature=0.7,
-            )
+    async def _async_cleanup_conversations(self, now: datetime) -> None:
+        """Delete idle conversations and superseded checkpoints.
 
-        elif provider == LLM_PROVIDER_ANTHROPIC:
-            if ChatAnthropic is None:
-                raise ValueError("langchain_anthropic is not installed")
-            return ChatAnthropic(
-                model=model,
-                api_key=api_key,
-                temperature=0.7,
+        Conversations idle past the retention period are removed. Every graph
+        step writes a new checkpoint, but only the latest one per thread is
+        read, so older checkpoints and their pending writes are pruned.
+        """
+        if self._checkpointer is None:
+            return
+
+        conn = self._checkpointer.conn
+        cutoff = time() - CONVERSATION_RETENTION.total_seconds()
+        async with conn.execute(
+            "SELECT thread_id FROM trikhub_threads WHERE last_used < ?", (cutoff,)
+        ) as cursor:
+            stale = [row[0] for row in await cursor.fetchall()]
+
+        for thread_id in stale:
+            await self._checkpointer.adelete_thread(thread_id)
+        await conn.execute("DELETE FROM trikhub_threads WHERE last_used < ?", (cutoff,))
+        await conn.commit()
+
+        async with self._checkpointer.lock:
+            await conn.execute(
+                "DELETE FROM checkpoints "
+                "WHERE (thread_id, checkpoint_ns, checkpoint_id) NOT IN ("
+                "SELECT thread_id, checkpoint_ns, MAX(checkpoint_id) "
+                "FROM checkpoints GROUP BY thread_id, checkpoint_ns)"
+            )
+            await conn.execute(
+                "DELETE FROM writes "
+                "WHERE (thread_id, checkpoint_ns, checkpoint_id) NOT IN ("
+                "SELECT thread_id, checkpoint_ns, checkpoint_id FROM checkpoints)"
             )
+            await conn.commit()
+
+        if stale:
+            _LOGGER.debug("Removed %d idle conversations", len(stale))
+
+    def _handle_passthrough(self, content: PassthroughContent) -> None:
+        """Store passthrough content for the turn that produced it."""
+        pending = _turn_passthrough.get()
+        if pending is None:
+            _LOGGER.warning("Dropping passthrough content received outside a turn")
+            return
+        pending.append(content)
+        _LOGGER.debug("Received passthrough content: %s", content.content_type)
 
-        elif provider == LLM_PROVIDER_OLLAMA:
-            if ChatOllama is None:
-                raise ValueError("langchain_ollama is not installed")
-            # For Ollama, api_key is actually the base URL
-            return ChatOllama(
-                model=model,
-                base_url=api_key or "http://localhost:11434",
-                temperature=0.7,
+    def _get_system_message(self) -> SystemMessage:
+        """Build the system message for the configured provider.
+
+        The system prompt and tool definitions form a static prefix that is
+        identical on every turn. Anthropic needs an explicit cache breakpoint
+        to reuse it; OpenAI caches identical prefixes automatically.
+        """
+        provider = self._config.get(CONF_LLM_PROVIDER, LLM_PROVIDER_OPENAI)
+        if provider == LLM_PROVIDER_ANTHROPIC:
+            return SystemMessage(
+                content=[
+                    {
+                        "type": "text",
+                        "text": SYSTEM_PROMPT,
+                        "cache_control": {"type": "ephemeral"},
+                    }
+                ]
             )
+        return SystemMessage(content=SYSTEM_PROMPT)
+
+    def _llm_params(self) -> tuple[str, str, str | None]:
+        """Return the (provider, model, api_key) the LLM is built from."""
+        return (
+            self._config.get(CONF_LLM_PROVIDER, LLM_PROVIDER_OPENAI),
+            self._config.get(CONF_LLM_MODEL, "gpt-4o-mini"),
+            self._config.get(CONF_LLM_API_KEY),
+        )
 
-        else:
-            raise ValueError(f"Unsupported LLM provider: {provider}")
+    def _get_llm(self) -> Any:
+        """Get the configured LLM instance."""
+        return _make_llm(*self._llm_params())
 
     async def _initialize_graph(self) -> None:
-        """Initialize the LangGraph agent with tools."""
+        """Initialize the LangGraph agent with tools.
+
+        The compiled graph is kept across reloads when the tool set is
+        unchanged; only the LLM tool binding is refreshed.
+        """
         _LOGGER.info("Initializing LangGraph agent...")
 
         # Load tools from TrikHub server
+        # Anthropic and Ollama take JSON Schema tool definitions directly;
+        # OpenAI keeps Pydantic models for its nullable-optional handling
+        provider = self._config.get(CONF_LLM_PROVIDER, LLM_PROVIDER_OPENAI)
         tools_result = await load_trik_tools(
             self._client,
             on_passthrough=self._handle_passthrough,
+            raw_json_schema=provider in (LLM_PROVIDER_ANTHROPIC, LLM_PROVIDER_OLLAMA),
         )
-        self._tools = tools_result.tools
 
-        if not self._tools:
+        if not tools_result.tools:
             _LOGGER.warning("No tools loaded from TrikHub server")
 
         # Get the LLM
         self._llm = self._get_llm()
 
         # Bind tools to LLM
-        if self._tools:
-            llm_with_tools = self._llm.bind_tools(self._tools)
+        if tools_result.tools:
+            self._llm_with_tools = self._llm.bind_tools(tools_result.tools)
         else:
-            llm_with_tools = self._llm
+            self._llm_with_tools = self._llm
 
-        # Create the agent node
-        async def call_model(state: MessagesState) -> dict[str, Any]:
-            """Call the model with the current messages."""
-            messages = state["messages"]
+        self._fast_path = not tools_result.tools
 
-            # Add system prompt if not present
-            if not messages or not isinstance(messages[0], SystemMessage):
-                messages = [SystemMessage(content=SYSTEM_PROMPT)] + list(messages)
+        checkpointer = await self._async_get_checkpointer()
+
+        # Rebuild the graph only when the tools it executes have changed
+        if self._graph is None or tools_result.tool_schemas != self._tool_schemas:
+            self._tools = tools_result.tools
+            self._tool_schemas = tools_result.tool_schemas
+            self._build_graph(checkpointer)
+            # Cached answers were given without the new tools
+            self._response_cache.clear()
+        else:
+            _LOGGER.debug("Tool set unchanged, reusing compiled graph")
 
-            response = await llm_with_tools.ainvoke(messages)
-            return {"messages": [response]}
+        _LOGGER.info(
+            "LangGraph agent initialized with %d tools from %d triks",
+            len(self._tools),
+            len(tools_result.loaded_triks),
+        )
+
+    def _build_graph(self, checkpointer: AsyncSqliteSaver) -> None:
+        """Build and compile the agent graph for the current tools."""
+        # Create the agent node
+        async def call_model(state: TrikState) -> dict[str, Any]:
+            """Call the model with the current messages."""
+            messages = _trim_history(state["messages"])
+
+            # The system message is seeded as the first message of every
+            # thread (see async_process), so no check is needed here.
+            # Read the binding at call time so reloads take effect
+            response = await self._llm_with_tools.ainvoke(messages)
+
+            # Drop messages outside the window from the stored state too
+            return {
+                "messages": [
+                    *_removed_messages(state["messages"], messages),
+                    response,
+                ]
+            }
 
         # Create the routing function
-        def should_continue(state: MessagesState) -> Literal["tools", "__end__"]:
+        def should_continue(state: TrikState) -> Literal["tools", "__end__"]:
             """Determine if we should continue to tools or end."""
-            messages = state["messages"]
-            last_message = messages[-1]
-
-            if isinstance(last_message, AIMessage) and last_message.tool_calls:
+            # Only AIMessages carry tool_calls; a plain attribute read avoids
+            # an isinstance check on every graph step
+            if getattr(state["messages"][-1], "tool_calls", None):
                 return "tools"
             return "__end__"
 
+        def after_tools(state: TrikState) -> Literal["agent", "delivered"]:
+            """Skip the follow-up LLM call when every tool delivered passthrough.
+
+            The content already went to the user, so the agent's reply would
+            only be an acknowledgement that is dropped from the response.
+            """
+            results = []
+            for message in reversed(state["messages"]):
+                if not isinstance(message, ToolMessage):
+                    break
+                results.append(message.content)
+
+            if _turn_passthrough.get() and all(
+                result == PASSTHROUGH_DELIVERED for result in results
+            ):
+                return "delivered"
+            return "agent"
+
+        def delivered(state: TrikState) -> dict[str, Any]:
+            """Close the turn with a fixed acknowledgement."""
+            return {"messages": [AIMessage(content=PASSTHROUGH_ACK)]}
+
         # Build the graph
-        workflow = StateGraph(MessagesState)
+        workflow = StateGraph(TrikState)
 
         # Add nodes
         workflow.add_node("agent", call_model)
         if self._tools:
             workflow.add_node("tools", ToolNode(self._tools))
+            workflow.add_node("delivered", delivered)
 
         # Add edges
         workflow.add_edge(START, "agent")
@@ -249,83 +553,191 @@ class TrikHubConversationEntity(
                 should_continue,
                 ["tools", END],
             )
-            workflow.add_edge("tools", "agent")
+            workflow.add_conditional_edges(
+                "tools",
+                after_tools,
+                ["agent", "delivered"],
+            )
+            workflow.add_edge("delivered", END)
         else:
             workflow.add_edge("agent", END)
 
-        # Compile the graph
-        self._graph = workflow.compile()
+        # Compile the graph; the checkpointer outlives rebuilds on reload
+        self._graph = workflow.compile(checkpointer=checkpointer)
 
-        _LOGGER.info(
-            "LangGraph agent initialized with %d tools from %d triks",
-            len(self._tools),
-            len(tools_result.loaded_triks),
+    async def _async_invoke_llm(
+        self,
+        config: dict[str, Any],
+        history: list[BaseMessage],
+        new_messages: list[BaseMessage],
+    ) -> list[BaseMessage]:
+        """Run a turn as one LLM call, bypassing graph execution.
+
+        History comes from the checkpointer and the turn is written back to
+        it, so the conversation carries over if tools are loaded later.
+
+        Returns:
+            The full conversation, including the new response.
+        """
+        messages = [*history, *new_messages]
+        window = _trim_history(messages)
+        response = await self._llm_with_tools.ainvoke(window)
+        await self._graph.aupdate_state(
+            config,
+            {
+                "messages": [
+                    *_removed_messages(history, window),
+                    *new_messages,
+                    response,
+                ]
+            },
+            as_node="agent",
         )
+        return [*messages, response]
+
+    async def _async_touch_thread(self, conversation_id: str) -> None:
+        """Record that a conversation was used now, for cleanup."""
+        conn = (await self._async_get_checkpointer()).conn
+        await conn.execute(
+            "INSERT OR REPLACE INTO trikhub_threads (thread_id, last_used) "
+            "VALUES (?, ?)",
+            (conversation_id, time()),
+        )
+        await conn.commit()
+
+    def _response_cache_key(
+        self, text: str, language: str
+    ) -> tuple[str, str, str, str]:
+        """Build the response cache key for a user query."""
+        return (
+            _normalize_query(text),
+            language,
+            self._config.get(CONF_LLM_PROVIDER) or "",
+            self._config.get(CONF_LLM_MODEL) or "",
+        )
+
+    def _get_cached_response(self, key: tuple[str, str, str, str]) -> str | None:
+        """Return a cached response if present and not expired."""
+        entry = self._response_cache.get(key)
+        if entry is None:
+            return None
+        if monotonic() - entry[0] > RESPONSE_CACHE_TTL:
+            del self._response_cache[key]
+            return None
+        self._response_cache.move_to_end(key)
+        return entry[1]
+
+    def _cache_response(
+        self, key: tuple[str, str, str, str], response: str
+    ) -> None:
+        """Store a response, evicting the least recently used entry."""
+        self._response_cache[key] = (monotonic(), response)
+        self._response_cache.move_to_end(key)
+        if len(self._response_cache) > RESPONSE_CACHE_SIZE:
+            self._response_cache.popitem(last=False)
 
     async def async_process(
         self, user_input: ConversationInput
     ) -> ConversationResult:
         """Process a user input using the LangGraph agent."""
         conversation_id = user_input.conversation_id or ulid.ulid()
+        passthrough: list[PassthroughContent] = []
+        passthrough_token = _turn_passthrough.set(passthrough)
 
         try:
             # Initialize graph if needed
             if self._graph is None:
                 await self._initialize_graph()
 
-            # Get or create conversation history for this conversation_id
-            if conversation_id not in self._conversation_history:
-                self._conversation_history[conversation_id] = []
+            config = {"configurable": {"thread_id": conversation_id}}
+            await self._async_touch_thread(conversation_id)
+            user_message = HumanMessage(content=user_input.text)
+
+            # Seed new threads with the system message exactly once. A thread
+            # is new when nothing is checkpointed yet, so a first turn that
+            # failed before saving anything is seeded again on retry
+            state = await self._graph.aget_state(config)
+            history: list[BaseMessage] = state.values.get("messages", [])
+            new_conversation = not history
+            new_messages: list[BaseMessage] = (
+                [self._system_message, user_message]
+                if new_conversation
+                else [user_message]
+            )
 
-            messages = self._conversation_history[conversation_id]
+            # Opening questions that needed no tools can be answered from cache.
+            # Later turns depend on history, so they are never cached.
+            cache_key = (
+                self._response_cache_key(user_input.text, user_input.language)
+                if new_conversation
+                else None
+            )
+            if cache_key and (cached := self._get_cached_response(cache_key)):
+                _LOGGER.debug("Response cache hit for: %s", user_input.text)
+                await self._graph.aupdate_state(
+                    config,
+                    {"messages": [*new_messages, AIMessage(content=cached)]},
+                    as_node="agent",
+                )
 
-            # Add the new user message
-            messages.append(HumanMessage(content=user_input.text))
+                intent_response = intent.IntentResponse(language=user_input.language)
+                intent_response.async_set_speech(cached)
+                return ConversationResult(
+                    response=intent_response,
+                    conversation_id=conversation_id,
+                )
 
-            # Run the graph with full conversation history
+            # Run the graph; the checkpointer supplies earlier turns
             _LOGGER.debug(
-                "Running LangGraph with %d messages, latest: %s",
-                len(messages),
+                "Running LangGraph for conversation %s, latest: %s",
+                conversation_id,
                 user_input.text,
             )
 
-            result = await self._graph.ainvoke(
-                {"messages": messages},
-                config={"configurable": {"thread_id": conversation_id}},
-            )
-
-            # Update conversation history with full result (includes tool calls, responses, etc.)
-            result_messages = result.get("messages", [])
-            self._conversation_history[conversation_id] = list(result_messages)
-
-            # Extract the final response from the agent
-            agent_response_text = ""
-
-            for msg in reversed(result_messages):
-                if isinstance(msg, AIMessage) and msg.content:
-                    agent_response_text = msg.content
-                    break
+            if self._fast_path:
+                result_messages = await self._async_invoke_llm(
+                    config, history, new_messages
+                )
+            else:
+                result = await self._graph.ainvoke(
+                    {"messages": new_messages}, config=config
+                )
+                result_messages = result.get("messages", [])
+
+            # Extract the final response from the agent. The graph only ends
+            # on an AIMessage, so the last message is the answer in practice;
+            # scan backwards only if it is empty.
+            last = result_messages[-1] if result_messages else None
+            if isinstance(last, AIMessage) and last.content:
+                agent_response_text = last.content
+            else:
+                agent_response_text = next(
+                    (
+                        msg.content
+                        for msg in reversed(result_messages)
+                        if isinstance(msg, AIMessage) and msg.content
+                    ),
+                    "",
+                )
 
             # Build final response - passthrough content takes priority
             response_parts: list[str] = []
 
             # Check for passthrough content FIRST (bypasses agent, goes to user)
-            if self._last_passthrough:
+            used_passthrough = bool(passthrough)
+            if passthrough:
+                # The latest delivery wins, as for a single tool call
+                delivered_content = passthrough[-1]
                 _LOGGER.debug(
                     "Including passthrough content in response: %s (%d chars)",
-                    self._last_passthrough.content_type,
-                    len(self._last_passthrough.content),
+                    delivered_content.content_type,
+                    len(delivered_content.content),
                 )
-                response_parts.append(self._last_passthrough.content)
-                self._last_passthrough = None  # Clear after use
+                response_parts.append(delivered_content.content)
 
             # Add agent's verbal response if meaningful
             # Skip generic "content delivered" type responses when we have passthrough
-            skip_responses = {
-                "Content delivered directly to user",
-                "I processed your request but have no response.",
-            }
-            if agent_response_text and agent_response_text not in skip_responses:
+            if agent_response_text and agent_response_text not in _SKIP_RESPONSES:
                 # If we have passthrough content, the agent response is supplementary
                 if response_parts:
                     response_parts.append(f"\n{agent_response_text}")
@@ -336,6 +748,15 @@ class TrikHubConversationEntity(
 
             _LOGGER.debug("Final response: %s", final_response[:200])
 
+            # Only cache answers that did not depend on tool results
+            if (
+                cache_key
+                and response_parts
+                and not used_passthrough
+                and not any(isinstance(msg, ToolMessage) for msg in result_messages)
+            ):
+                self._cache_response(cache_key, final_response)
+
             # Create the response using IntentResponse
             intent_response = intent.IntentResponse(language=user_input.language)
             intent_response.async_set_speech(final_response)
@@ -345,15 +766,31 @@ class TrikHubConversationEntity(
                 conversation_id=conversation_id,
             )
 
-        except Exception as err:
-            _LOGGER.exception("Error processing conversation: %s", err)
-            intent_response = intent.IntentResponse(language=user_input.language)
-            intent_response.async_set_speech(f"Error processing request: {err}")
-
-            return ConversationResult(
-                response=intent_response,
-                conversation_id=conversation_id,
-            )
+        # Expected failures are logged without a traceback, and the spoken
+        # message never includes the raw error (it may contain credentials).
+        # TrikHub client errors are handled by tool loading and the tools.
+        except _TIMEOUT_ERRORS as err:
+            _LOGGER.warning("Timed out processing conversation: %s", err)
+            message = "Sorry, the request timed out. Please try again."
+        except _AUTH_ERRORS as err:
+            _LOGGER.warning("LLM provider rejected the API key: %s", err)
+            message = "Sorry, the language model rejected the configured API key."
+        except LLMConfigError as err:
+            _LOGGER.warning("Invalid TrikHub configuration: %s", err)
+            message = "Sorry, the TrikHub assistant is not configured correctly."
+        except Exception:
+            _LOGGER.exception("Error processing conversation")
+            message = "Sorry, something went wrong while processing your request."
+        finally:
+            _turn_passthrough.reset(passthrough_token)
+
+        intent_response = intent.IntentResponse(language=user_input.language)
+        intent_response.async_set_speech(message)
+
+        return ConversationResult(
+            response=intent_response,
+            conversation_id=conversation_id,
+        )
 
     async def async_reload_tools(self) -> int:
         """Reload tools from the TrikHub server.
@@ -363,12 +800,7 @@ class TrikHubConversationEntity(
         """
         _LOGGER.info("Reloading TrikHub tools...")
 
-        # Reset the graph to force reinitialization
-        self._graph = None
-        self._tools = []
-        self._llm = None
-
-        # Reinitialize
+        # Reinitialize; the compiled graph is reused if the tools match
         await self._initialize_graph()
 
         return len(self._tools)
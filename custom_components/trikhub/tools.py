@@ -6,24 +6,72 @@ Creates LangChain tools from TrikHub server API for use with LangGraph.
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import hashlib
 import json
 import logging
+from collections.abc import Mapping
 from dataclasses import dataclass, field
-from typing import Any, Callable, Literal
+from types import MappingProxyType
+from typing import Any, Callable, Literal, Union
 
 from langchain_core.tools import StructuredTool
 from pydantic import BaseModel, Field, create_model
 
+try:
+    import orjson
+except ImportError:  # orjson ships with Home Assistant but is optional here
+    orjson = None  # type: ignore
+
 from .client import TrikHubClient, TrikHubClientError
 
 _LOGGER = logging.getLogger(__name__)
 
+# JSON helpers: orjson when available, stdlib otherwise
+if orjson is not None:
+
+    def _dumps(obj: Any) -> str:
+        """Serialize obj to a JSON string."""
+        return orjson.dumps(obj).decode()
+
+    def _canonical_json(obj: Any) -> bytes:
+        """Serialize obj to JSON bytes with sorted keys, for hashing."""
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+
+else:
+    # One shared compact encoder instead of a json.dumps setup per call;
+    # non-ASCII is kept as is, matching orjson output
+    _dumps = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+
+    def _canonical_json(obj: Any) -> bytes:
+        """Serialize obj to JSON bytes with sorted keys, for hashing."""
+        return json.dumps(obj, sort_keys=True).encode()
+
+# Tool result returned to the agent once passthrough content reaches the user
+PASSTHROUGH_DELIVERED = _dumps(
+    {"success": True, "delivered": "Content delivered directly to user"}
+)
+
+# Generated Pydantic models, keyed by a hash of model name and schema
+_MODEL_CACHE: dict[str, type[BaseModel]] = {}
+
 
 # =============================================================================
 # JSON Schema to Pydantic Conversion
 # =============================================================================
 
 
+_TYPE_MAP: dict[str, Any] = {
+    "string": str,
+    "number": float,
+    "integer": int,
+    "boolean": bool,
+    "null": type(None),
+    "object": dict[str, Any],
+}
+
+
 def _get_python_type(schema: dict[str, Any]) -> type:
     """
     Convert a JSON Schema type to a Python type.
@@ -34,32 +82,27 @@ def _get_python_type(schema: dict[str, Any]) -> type:
     Returns:
         Corresponding Python type
     """
-    schema_type = schema.get("type")
-
     # Handle enum
     if "enum" in schema:
         enum_values = tuple(schema["enum"])
         return Literal[enum_values]  # type: ignore
 
+    # Handle unions (anyOf/oneOf, or a list of types)
+    variants = schema.get("anyOf") or schema.get("oneOf")
+    if variants:
+        return Union[tuple(_get_python_type(variant) for variant in variants)]  # type: ignore
+    schema_type = schema.get("type")
+    if isinstance(schema_type, list):
+        return Union[tuple(_TYPE_MAP.get(t, Any) for t in schema_type)]  # type: ignore
+
     # Handle basic types
-    if schema_type == "string":
-        return str
-    elif schema_type == "number":
-        return float
-    elif schema_type == "integer":
-        return int
-    elif schema_type == "boolean":
-        return bool
-    elif schema_type == "null":
-        return type(None)
-    elif schema_type == "array":
-        items_schema = schema.get("items", {})
-        item_type = _get_python_type(items_schema)
+    base_type = _TYPE_MAP.get(schema_type)  # type: ignore[arg-type]
+    if base_type is not None:
+        return base_type
+    if schema_type == "array":
+        item_type = _get_python_type(schema.get("items", {}))
         return list[item_type]  # type: ignore
-    elif schema_type == "object":
-        return dict[str, Any]
-    else:
-        return Any  # type: ignore
+    return Any  # type: ignore
 
 
 def json_schema_to_pydantic(
@@ -69,6 +112,9 @@ def json_schema_to_pydantic(
     """
     Convert a JSON Schema to a Pydantic model.
 
+    Models are cached by schema, so reloading tools whose schemas did not
+    change reuses the classes built before.
+
     Args:
         schema: JSON Schema dictionary (must be an object schema)
         model_name: Name for the generated Pydantic model
@@ -76,6 +122,64 @@ def json_schema_to_pydantic(
     Returns:
         A dynamically created Pydantic model class
     """
+    key = _model_cache_key(schema, model_name)
+
+    model = _MODEL_CACHE.get(key)
+    if model is None:
+        model = _MODEL_CACHE[key] = _build_pydantic_model(schema, model_name)
+    return model
+
+
+async def _async_json_schema_to_pydantic(
+    schema: dict[str, Any],
+    model_name: str,
+) -> type[BaseModel]:
+    """Convert a JSON Schema to a Pydantic model without blocking the loop.
+
+    Cached models are returned directly; only cache misses are built in a
+    worker thread, since model synthesis is CPU bound.
+    """
+    key = _model_cache_key(schema, model_name)
+
+    model = _MODEL_CACHE.get(key)
+    if model is None:
+        model = _MODEL_CACHE[key] = await asyncio.to_thread(
+            _build_pydantic_model, schema, model_name
+        )
+    return model
+
+
+def _is_object_schema(schema: dict[str, Any]) -> bool:
+    """Return whether a schema can be sent to an LLM provider as is.
+
+    Providers that take raw JSON Schema (Anthropic in particular) require
+    tool input schemas of type object; anything else goes through a model.
+    """
+    return schema.get("type") == "object"
+
+
+async def _async_args_schema(
+    schema: dict[str, Any],
+    model_name: str,
+    raw_json_schema: bool,
+) -> type[BaseModel] | dict[str, Any]:
+    """Return the tool args schema: raw JSON Schema or a Pydantic model."""
+    if raw_json_schema and _is_object_schema(schema):
+        return schema
+    return await _async_json_schema_to_pydantic(schema, model_name)
+
+
+def _model_cache_key(schema: dict[str, Any], model_name: str) -> str:
+    """Return the _MODEL_CACHE key for a schema and model name."""
+    canonical = _canonical_json([model_name, schema])
+    return hashlib.blake2b(canonical, digest_size=16).hexdigest()
+
+
+def _build_pydantic_model(
+    schema: dict[str, Any],
+    model_name: str,
+) -> type[BaseModel]:
+    """Build a Pydantic model from a JSON Schema without caching."""
     if schema.get("type") != "object":
         # For non-object schemas, wrap in a simple model
         return create_model(model_name, value=(_get_python_type(schema), ...))
@@ -110,6 +214,7 @@ def json_schema_to_pydantic(
 # =============================================================================
 
 
+@functools.lru_cache(maxsize=2048)
 def _to_tool_name(gateway_name: str) -> str:
     """
     Convert a gateway tool name to a LangChain-compatible tool name.
@@ -117,6 +222,8 @@ def _to_tool_name(gateway_name: str) -> str:
     LangChain tool names must be valid Python identifiers.
     Example: "@molefas/article-search:list" -> "molefas_article_search__list"
     """
+    # A chain of str.replace beats both str.translate and a regex substitution
+    # for these short names
     return (
         gateway_name.replace("@", "")
         .replace("/", "_")
@@ -125,6 +232,7 @@ def _to_tool_name(gateway_name: str) -> str:
     )
 
 
+@functools.lru_cache(maxsize=2048)
 def _from_tool_name(langchain_name: str) -> str:
     """
     Convert a LangChain tool name back to gateway format.
@@ -141,7 +249,7 @@ def _from_tool_name(langchain_name: str) -> str:
     return langchain_name.replace("_", "-")
 
 
-@dataclass
+@dataclass(slots=True)
 class PassthroughContent:
     """Content delivered directly to the user (passthrough mode)."""
 
@@ -150,7 +258,7 @@ class PassthroughContent:
     metadata: dict[str, Any] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TrikToolsResult:
     """Result from loading tools from TrikHub server."""
 
@@ -160,69 +268,122 @@ class TrikToolsResult:
     sessions: dict[str, str] = field(default_factory=dict)  # trik_id -> session_id
 
 
-def _normalize_input(input_data: dict[str, Any], schema: dict[str, Any]) -> dict[str, Any]:
+# Marker returned by a coercer to drop the field from the input
+_DROP = object()
+
+# Shared read-only schema for tools created without one
+_EMPTY_SCHEMA: Mapping[str, Any] = MappingProxyType({})
+
+
+def _keep(key: str, value: Any) -> Any:
+    """Return the value unchanged (it already has the expected type)."""
+    return value
+
+
+def _wrap_in_list(key: str, value: Any) -> Any:
+    """Wrap a non-list value in a list (LLMs often pass a single item)."""
+    _LOGGER.debug(
+        "[Normalize] Coercing %s from %s to array", key, type(value).__name__
+    )
+    return [value]
+
+
+def _unwrap_to_string(key: str, value: list[Any]) -> Any:
+    """Convert a list to a string of its first item."""
+    if not value:
+        # Empty array, remove the field
+        _LOGGER.debug("[Normalize] Removed empty array field: %s", key)
+        return _DROP
+    _LOGGER.debug("[Normalize] Coercing %s from array to string", key)
+    return str(value[0])
+
+
+def _to_string(key: str, value: Any) -> Any:
+    """Convert a non-string value to a string."""
+    _LOGGER.debug(
+        "[Normalize] Coercing %s from %s to string", key, type(value).__name__
+    )
+    return str(value)
+
+
+_Coercer = Callable[[str, Any], Any]
+
+# Per schema type: coercers keyed by the exact type of the value, and the
+# coercer used for any other value type
+_COERCERS: dict[str, tuple[dict[type, _Coercer], _Coercer]] = {
+    "array": ({list: _keep}, _wrap_in_list),
+    "string": ({str: _keep, list: _unwrap_to_string}, _to_string),
+}
+
+
+def _coercion_target(prop_schema: Any) -> str | None:
+    """Return the type a property's values are coerced to, if any.
+
+    A list type with a single non-null member, such as ["string", "null"],
+    coerces to that member; other unions are left alone.
+    """
+    if not isinstance(prop_schema, dict):
+        return None
+    schema_type = prop_schema.get("type")
+    if isinstance(schema_type, list):
+        non_null = [t for t in schema_type if t != "null"]
+        schema_type = non_null[0] if len(non_null) == 1 else None
+    return schema_type if isinstance(schema_type, str) else None
+
+
+def _passthrough_input(input_data: dict[str, Any]) -> dict[str, Any]:
+    """Return input unchanged (schema is not an object schema)."""
+    return input_data
+
+
+def _compile_normalizer(
+    schema: Mapping[str, Any],
+) -> Callable[[dict[str, Any]], dict[str, Any]]:
     """
-    Normalize input data to match expected schema types.
+    Build a function that normalizes input data to match a schema.
 
+    The schema is inspected once, when the tool is created; the returned
+    function only applies the coercers planned for its properties.
     Handles common LLM mistakes like passing a string when an array is expected,
     or passing null/None values.
     """
     if schema.get("type") != "object":
-        return input_data
-
-    properties = schema.get("properties", {})
-    required = set(schema.get("required", []))
-    result = dict(input_data)
-
-    # Remove None values for optional fields (LLM often sends null for optional params)
-    keys_to_remove = []
-    for key, value in result.items():
-        if value is None and key not in required:
-            keys_to_remove.append(key)
-    for key in keys_to_remove:
-        del result[key]
-        _LOGGER.debug("[Normalize] Removed null optional field: %s", key)
-
-    for key, prop_schema in properties.items():
-        if key not in result:
-            continue
-
-        value = result[key]
-        expected_type = prop_schema.get("type")
-
-        # Skip if value is None (will be handled by server validation)
-        if value is None:
-            continue
-
-        # Coerce string to array if schema expects array
-        if expected_type == "array":
-            if isinstance(value, str):
-                _LOGGER.debug("[Normalize] Coercing %s from string to array", key)
-                result[key] = [value]
-            elif isinstance(value, dict):
-                # LLM sometimes passes object, wrap in array
-                _LOGGER.debug("[Normalize] Coercing %s from object to array", key)
-                result[key] = [value]
-            elif not isinstance(value, list):
-                # Wrap any non-list value in an array
-                _LOGGER.debug("[Normalize] Coercing %s from %s to array", key, type(value).__name__)
-                result[key] = [value]
-
-        # Coerce to string if schema expects string
-        elif expected_type == "string":
-            if isinstance(value, list) and len(value) > 0:
-                _LOGGER.debug("[Normalize] Coercing %s from array to string", key)
-                result[key] = str(value[0])
-            elif isinstance(value, list) and len(value) == 0:
-                # Empty array, remove the field
-                del result[key]
-                _LOGGER.debug("[Normalize] Removed empty array field: %s", key)
-            elif not isinstance(value, str):
-                _LOGGER.debug("[Normalize] Coercing %s from %s to string", key, type(value).__name__)
-                result[key] = str(value)
-
-    _LOGGER.debug("[Normalize] Result: %s", result)
-    return result
+        return _passthrough_input
+
+    required = frozenset(schema.get("required", ()))
+    coercers = {
+        key: _COERCERS[target]
+        for key, prop_schema in schema.get("properties", {}).items()
+        if (target := _coercion_target(prop_schema)) in _COERCERS
+    }
+
+    def normalize(input_data: dict[str, Any]) -> dict[str, Any]:
+        """Normalize input data for this tool's schema."""
+        # Nothing to strip or coerce, return the input without copying
+        if not input_data or (
+            not coercers and not any(value is None for value in input_data.values())
+        ):
+            return input_data
+
+        result: dict[str, Any] = {}
+
+        for key, value in input_data.items():
+            if value is None:
+                # Remove None values for optional fields (LLM often sends null
+                # for optional params); required ones are left to the server
+                if key not in required:
+                    _LOGGER.debug("[Normalize] Removed null optional field: %s", key)
+                    continue
+            elif (coercion := coercers.get(key)) is not None:
+                by_type, default = coercion
+                value = by_type.get(type(value), default)(key, value)
+                if value is _DROP:
+                    continue
+            result[key] = value
+
+        return result
+
+    return normalize
 
 
 def _create_tool_function(
@@ -232,31 +393,39 @@ def _create_tool_function(
     sessions: dict[str, str],
     input_schema: dict[str, Any] | None = None,
     on_passthrough: Callable[[PassthroughContent], None] | None = None,
-    debug: bool = False,
 ) -> Callable[..., str]:
     """
     Create a tool function that calls the TrikHub server.
 
+    Tools sharing a sessions dict share trik sessions. Tool calls from one
+    model response run concurrently, so a returned session ID is only stored
+    if the trik's session is still the one the call started with; a call
+    never overwrites a session another call stored meanwhile. Callers that
+    need per-request isolation should pass a fresh dict.
+
     Args:
         client: TrikHub API client
         tool_name: Tool name in format 'trikId:actionName'
         trik_id: The trik identifier (for session tracking)
         sessions: Shared session storage dict (trik_id -> session_id)
         input_schema: JSON Schema for input (used for normalization)
-        on_passthrough: Callback for passthrough content
-        debug: Enable debug logging
+        on_passthrough: Callback for passthrough content, called before the
+            tool returns so the agent can route on it; it must not block
 
     Returns:
         Async function that executes the tool
     """
 
+    # Plan input normalization once per tool rather than on every call
+    normalize = _compile_normalizer(input_schema or _EMPTY_SCHEMA)
+
     async def tool_func(**kwargs: Any) -> str:
         """Execute the tool via TrikHub server."""
         # Log raw input for debugging
         _LOGGER.debug("[Tool] %s raw input: %s", tool_name, kwargs)
 
         # Normalize input to handle LLM mistakes (e.g., string instead of array)
-        normalized_kwargs = _normalize_input(kwargs, input_schema or {})
+        normalized_kwargs = normalize(kwargs)
 
         # Get existing session ID for this trik
         session_id = sessions.get(trik_id)
@@ -266,23 +435,30 @@ def _create_tool_function(
         try:
             result = await client.execute(tool_name, normalized_kwargs, session_id=session_id)
 
-            # Store session ID from response for future calls
-            if result.get("sessionId"):
-                sessions[trik_id] = result["sessionId"]
-                if debug:
-                    _LOGGER.debug("[Tool] Session tracked for %s: %s", trik_id, result["sessionId"])
+            new_session_id = result.get("sessionId")
+            error = result.get("error")
+            response_mode = result.get("responseMode")
+
+            # Store session ID from response for future calls, unless a
+            # concurrent call already replaced the session this one used
+            if (
+                new_session_id
+                and new_session_id != session_id
+                and sessions.get(trik_id) == session_id
+            ):
+                sessions[trik_id] = new_session_id
+                _LOGGER.debug("[Tool] Session tracked for %s: %s", trik_id, new_session_id)
 
             # Check for errors - server returns responseMode for success, error field for failures
-            if result.get("error"):
-                error = result.get("error", "Unknown error")
+            if error:
                 _LOGGER.warning(
                     "[Tool] Error from server for %s: %s (sent: %s)",
                     tool_name, error, normalized_kwargs
                 )
-                return json.dumps({"success": False, "error": error})
+                return _dumps({"success": False, "error": error})
 
             # Handle passthrough mode - fetch content and deliver to user
-            if result.get("responseMode") == "passthrough":
+            if response_mode == "passthrough":
                 content_ref = result.get("userContentRef")
                 content_type = result.get("contentType", "text/plain")
 
@@ -291,24 +467,25 @@ def _create_tool_function(
                     content_result = await client.get_content(content_ref)
 
                     # Content endpoint returns {content: {...}, receipt: {...}}
-                    if content_result and content_result.get("content"):
-                        content_data = content_result.get("content", {})
+                    content_data = content_result.get("content") if content_result else None
+                    if content_data:
+                        body = content_data.get("content", "")
 
                         # Deliver to user via callback
                         if on_passthrough:
                             on_passthrough(
                                 PassthroughContent(
                                     content_type=content_data.get("contentType", content_type),
-                                    content=content_data.get("content", ""),
+                                    content=body,
                                     metadata=content_data.get("metadata"),
                                 )
                             )
 
-                        if debug:
+                        if _LOGGER.isEnabledFor(logging.DEBUG):
                             _LOGGER.debug(
                                 "[Tool] Delivered passthrough content: %s (%d chars)",
                                 content_type,
-                                len(content_data.get("content", "")),
+                                len(body),
                             )
                     else:
                         _LOGGER.warning(
@@ -317,25 +494,23 @@ def _create_tool_function(
                         )
 
                 # Tell agent content was delivered (agent never sees the actual content)
-                return json.dumps(
-                    {"success": True, "delivered": "Content delivered directly to user"}
-                )
+                return PASSTHROUGH_DELIVERED
 
             # Handle template mode
-            if result.get("responseMode") == "template":
+            if response_mode == "template":
                 response = result.get("response", "")
 
-                if debug:
+                if _LOGGER.isEnabledFor(logging.DEBUG):
                     _LOGGER.debug("[Tool] Template response: %s", response[:100])
 
-                return json.dumps({"success": True, "response": response})
+                return _dumps({"success": True, "response": response})
 
             # Fallback: return the raw result
-            return json.dumps(result)
+            return _dumps(result)
 
         except TrikHubClientError as err:
             _LOGGER.error("Tool execution failed: %s", err)
-            return json.dumps({"success": False, "error": str(err)})
+            return _dumps({"success": False, "error": str(err)})
 
     return tool_func
 
@@ -343,7 +518,7 @@ def _create_tool_function(
 async def load_trik_tools(
     client: TrikHubClient,
     on_passthrough: Callable[[PassthroughContent], None] | None = None,
-    debug: bool = False,
+    raw_json_schema: bool = False,
 ) -> TrikToolsResult:
     """
     Load tools from the TrikHub server and convert them to LangChain tools.
@@ -351,26 +526,29 @@ async def load_trik_tools(
     Args:
         client: TrikHub API client
         on_passthrough: Callback for passthrough content
-        debug: Enable debug logging
+        raw_json_schema: Pass object input schemas to the LLM as JSON Schema
+            instead of building Pydantic models (for providers that accept it)
 
     Returns:
         TrikToolsResult with LangChain tools and metadata
     """
     try:
-        # Fetch tools from the server
-        server_tools = await client.get_tools()
-        triks = await client.get_triks()
+        # Fetch tools and triks from the server concurrently
+        server_tools, triks = await asyncio.gather(
+            client.get_tools(), client.get_triks()
+        )
 
         tools: list[StructuredTool] = []
         tool_schemas: dict[str, dict[str, Any]] = {}
         loaded_triks: list[str] = [trik.get("id", "") for trik in triks]
         sessions: dict[str, str] = {}  # Shared session storage for all tools
 
-        if debug:
-            _LOGGER.debug(
-                "[LangChainAdapter] Creating %d tools from server", len(server_tools)
-            )
+        _LOGGER.debug(
+            "[LangChainAdapter] Creating %d tools from server", len(server_tools)
+        )
 
+        # Collect the tool definitions first so their models can be built together
+        tool_defs: list[tuple[str, str, str, dict[str, Any]]] = []
         for tool_def in server_tools:
             tool_name = tool_def.get("name", "")
             description = tool_def.get("description", "No description")
@@ -379,9 +557,6 @@ async def load_trik_tools(
             if not tool_name:
                 continue
 
-            # Extract trik ID from tool name (format: "trik-id:action-name")
-            trik_id = tool_name.split(":")[0] if ":" in tool_name else tool_name
-
             # Create a LangChain-safe function name
             langchain_name = _to_tool_name(tool_name)
 
@@ -391,36 +566,52 @@ async def load_trik_tools(
                 "schema": input_schema,
             }
 
-            # Create the tool function with session tracking
-            tool_func = _create_tool_function(
-                client, tool_name, trik_id, sessions, input_schema, on_passthrough, debug
-            )
+            tool_defs.append((tool_name, langchain_name, description, input_schema))
 
-            # Convert JSON Schema to Pydantic model for proper argument handling
-            try:
-                pydantic_model = json_schema_to_pydantic(
-                    input_schema, model_name=f"{langchain_name}_Input"
+        # Convert JSON Schemas to Pydantic models for proper argument handling.
+        # Models not cached yet are built concurrently in worker threads
+        args_schemas: list[
+            type[BaseModel] | dict[str, Any] | BaseException
+        ] = await asyncio.gather(
+            *(
+                _async_args_schema(
+                    input_schema, f"{langchain_name}_Input", raw_json_schema
                 )
-            except Exception as err:
+                for _, langchain_name, _, input_schema in tool_defs
+            ),
+            return_exceptions=True,
+        )
+
+        for (tool_name, langchain_name, description, input_schema), args_schema in zip(
+            tool_defs, args_schemas
+        ):
+            if isinstance(args_schema, BaseException):
                 _LOGGER.warning(
                     "Failed to create Pydantic model for %s: %s, using raw kwargs",
                     tool_name,
-                    err,
+                    args_schema,
                 )
-                pydantic_model = None
+                args_schema = None
+
+            # Extract trik ID from tool name (format: "trik-id:action-name")
+            trik_id = tool_name.partition(":")[0]
+
+            # Create the tool function with session tracking
+            tool_func = _create_tool_function(
+                client, tool_name, trik_id, sessions, input_schema, on_passthrough
+            )
 
             # Create the StructuredTool
             tool = StructuredTool.from_function(
                 coroutine=tool_func,
                 name=langchain_name,
                 description=description,
-                args_schema=pydantic_model,
+                args_schema=args_schema,
             )
 
             tools.append(tool)
 
-            if debug:
-                _LOGGER.debug("  - %s -> %s", tool_name, langchain_name)
+            _LOGGER.debug("  - %s -> %s", tool_name, langchain_name)
 
         _LOGGER.info("Loaded %d tools from %d triks", len(tools), len(loaded_triks))
 
@@ -443,7 +634,7 @@ def create_dynamic_tool(
     input_schema: dict[str, Any],
     sessions: dict[str, str] | None = None,
     on_passthrough: Callable[[PassthroughContent], None] | None = None,
-    debug: bool = False,
+    raw_json_schema: bool = False,
 ) -> StructuredTool:
     """
     Create a single dynamic LangChain tool for a TrikHub tool.
@@ -453,31 +644,38 @@ def create_dynamic_tool(
         name: Tool name (trikId:actionName format)
         description: Tool description
         input_schema: JSON Schema for input
-        sessions: Optional shared session storage dict
+        sessions: Optional shared session storage dict (pass a fresh dict
+            for per-request isolation)
         on_passthrough: Callback for passthrough content
-        debug: Enable debug logging
+        raw_json_schema: Use an object input_schema as-is instead of a
+            Pydantic model
 
     Returns:
         LangChain StructuredTool
     """
     langchain_name = _to_tool_name(name)
-    trik_id = name.split(":")[0] if ":" in name else name
-    sessions = sessions or {}
+    trik_id = name.partition(":")[0]
+    if sessions is None:
+        sessions = {}
     tool_func = _create_tool_function(
-        client, name, trik_id, sessions, input_schema, on_passthrough, debug
+        client, name, trik_id, sessions, input_schema, on_passthrough
     )
 
     # Convert JSON Schema to Pydantic model
-    try:
-        pydantic_model = json_schema_to_pydantic(
-            input_schema, model_name=f"{langchain_name}_Input"
-        )
-    except Exception:
-        pydantic_model = None
+    args_schema: type[BaseModel] | dict[str, Any] | None
+    if raw_json_schema and _is_object_schema(input_schema):
+        args_schema = input_schema
+    else:
+        try:
+            args_schema = json_schema_to_pydantic(
+                input_schema, model_name=f"{langchain_name}_Input"
+            )
+        except Exception:
+            args_schema = None
 
     return StructuredTool.from_function(
         coroutine=tool_func,
         name=langchain_name,
         description=description,
-        args_schema=pydantic_model,
+        args_schema=args_schema,
     )